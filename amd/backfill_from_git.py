@@ -1,13 +1,24 @@
 """Backfill AMD keys availability CSV from git history of amd_response.json.
 
 This script walks the git history for pages/data/amd_response.json, extracts
-keysAvailable per promotion at each commit, and appends rows to
+keysAvailable per promotion at each commit that changed a recorded field, and appends rows to
 pages/data/amd_gaming_keys_available.csv using the commit timestamp.
 
 Usage:
-    uv run python amd/backfill_from_git.py
+    uv run python amd/backfill_from_git.py [--git-cli]
 
 Notes:
+- Reads history in-process through pygit2 (libgit2) when it is installed
+  (`uv pip install pygit2`), otherwise through the git CLI. Pass `--git-cli`
+  to force the git CLI.
+- Reads the existing CSV with pandas' C parser when pandas is installed
+- Only reads commits whose diff touches a field the CSV records (`id`, `title`,
+  `slug`, `keysAvailable` or `status`), snapshots where just other fields
+  changed would produce the same rows
+- In a partial clone (`git clone --filter=blob:none`) only the blobs of those
+  commits are fetched, in one batch. pygit2 can't fetch missing objects, so
+  the git CLI is used there.
+- In a shallow clone only the history after the shallow boundary is backfilled
 - Uses commit author timestamp (UTC) for the `timestamp` column
 - Skips commits where the file doesn't exist or JSON is invalid
 - Avoids writing duplicate (timestamp, promotion_id) rows already in CSV
@@ -15,52 +26,60 @@ Notes:
 
 from __future__ import annotations
 
+import argparse
 import csv
-import json
+import os
+import pickle  # noqa: S403 - only loads the cache file this script writes
+import re
 import shutil
 import subprocess  # noqa: S404 - controlled git CLI usage
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC
 from datetime import datetime
+from importlib.util import find_spec
+from itertools import batched
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
 
+import orjson
 from loguru import logger
 
+# Optional dependencies, the git CLI and the csv module are used without them. They are
+# imported where they are used, so the module names are never rebound to None and stay
+# valid in annotations.
+_HAS_PYGIT2: bool = find_spec("pygit2") is not None
+_HAS_PANDAS: bool = find_spec("pandas") is not None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+    from typing import IO
+    from typing import Self
+
 REPO_ROOT: Path = Path(__file__).resolve().parent.parent
 JSON_REL_PATH = Path("pages/data/amd_response.json")
 CSV_REL_PATH = Path("pages/data/amd_gaming_keys_available.csv")
 
+# Commits are only read if their diff of the JSON touches one of the fields the CSV records
+PICKAXE_FIELDS: tuple[str, ...] = ("id", "title", "slug", "keysAvailable", "status")
+PICKAXE_PATTERN: str = f'"({"|".join(PICKAXE_FIELDS)})"'  # POSIX extended regex for `git log -G`
+PICKAXE_LINE_RE: re.Pattern[bytes] = re.compile(f'"(?:{"|".join(PICKAXE_FIELDS)})"[^\\n]*'.encode())
 
-@dataclass(frozen=True)
-class CsvRow:
-    timestamp: str
-    promotion_id: str | None
-    title: str | None
-    slug: str | None
-    keys_available: int | None
-    status: str | None
+# Number of snapshots handed to a worker process at a time
+PARSE_CHUNK_SIZE = 200
 
-    def as_dict(self) -> dict[str, Any]:
-        return {
-            "timestamp": self.timestamp,
-            "promotion_id": self.promotion_id,
-            "title": self.title,
-            "slug": self.slug,
-            "keys_available": self.keys_available,
-            "status": self.status,
-        }
+# Column order of the keys availability CSV, rows are plain tuples in this order
+CSV_COLUMNS: tuple[str, ...] = ("timestamp", "promotion_id", "title", "slug", "keys_available", "status")
+type CsvRow = tuple[str, str | None, str | None, str | None, int | None, str | None]
 
 
-def run_git_command(args: list[str]) -> subprocess.CompletedProcess[str]:
-    """Run a git command and return the completed process.
-
-    Args:
-        args: Arguments to pass to the git executable (without the executable itself).
+def get_git_executable() -> str:
+    """Resolve the git executable on PATH.
 
     Returns:
-        The completed process with stdout/stderr captured as text.
+        Absolute path to the git executable.
 
     Raises:
         RuntimeError: If the git executable cannot be located on PATH.
@@ -69,24 +88,188 @@ def run_git_command(args: list[str]) -> subprocess.CompletedProcess[str]:
     if not git_exe:
         msg = "git executable not found on PATH"
         raise RuntimeError(msg)
+    return git_exe
+
+
+def run_git_command(args: list[str], input_text: str | None = None) -> subprocess.CompletedProcess[str]:
+    """Run a git command and return the completed process.
 
+    Args:
+        args: Arguments to pass to the git executable (without the executable itself).
+        input_text: Text to write to the command's stdin, if any.
+
+    Returns:
+        The completed process with stdout/stderr captured as text.
+    """
     return subprocess.run(  # noqa: S603 - arguments are static and executable is resolved
-        [git_exe, *args],
+        [get_git_executable(), *args],
         cwd=REPO_ROOT,
+        input=input_text,
         text=True,
         check=True,
         capture_output=True,
     )
 
 
+def is_shallow_repository() -> bool:
+    """Return whether the repository is a shallow clone (history cut off at a depth)."""
+    try:
+        result: subprocess.CompletedProcess[str] = run_git_command(["rev-parse", "--is-shallow-repository"])
+    except subprocess.CalledProcessError:
+        return False
+    return result.stdout.strip() == "true"
+
+
+def is_partial_clone() -> bool:
+    """Return whether the repository is a partial clone of origin, e.g. cloned with `--filter=blob:none`."""
+    try:
+        result: subprocess.CompletedProcess[str] = run_git_command(["config", "--get", "remote.origin.partialclonefilter"])
+    except subprocess.CalledProcessError:
+        # git config exits with 1 when the key isn't set
+        return False
+    return bool(result.stdout.strip())
+
+
+def list_blob_ids(rel_path: Path) -> list[str]:
+    """Return the ids of every version of rel_path in history, without reading the blobs.
+
+    The ids come from `git log --raw`, which only compares trees, so nothing is
+    fetched from the remote in a partial clone.
+
+    Args:
+        rel_path: Path of the file relative to the repository root.
+
+    Returns:
+        Unique blob ids, newest first.
+    """
+    try:
+        result: subprocess.CompletedProcess[str] = run_git_command(["--no-pager", "log", "--raw", "--no-abbrev", "--format=", "--", rel_path.as_posix()])
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"Failed to list blob ids: {e.stderr}")
+        return []
+
+    # Raw lines look like ":100644 100644 <old blob> <new blob> M\t<path>", deletions have an all-zero new blob
+    blob_ids: dict[str, None] = {}
+    for line in result.stdout.splitlines():
+        fields: list[str] = line.split()
+        if len(fields) >= 5 and line.startswith(":") and fields[3].strip("0"):  # noqa: PLR2004 - modes, blobs and status
+            blob_ids[fields[3]] = None
+    return list(blob_ids)
+
+
+def prefetch_blobs(blob_ids: list[str]) -> None:
+    """Fetch blob_ids from origin in a single request, for partial clones.
+
+    Without this every blob missing locally would be faulted in by its own fetch
+    when `git cat-file --batch` reads it. The options match the fetch git itself
+    runs for missing objects of a partial clone.
+
+    Args:
+        blob_ids: Ids of the blobs to fetch.
+    """
+    if not blob_ids:
+        return
+
+    logger.info(f"Prefetching {len(blob_ids)} blobs from origin")
+    try:
+        run_git_command(
+            [
+                "-c",
+                "fetch.negotiationAlgorithm=noop",
+                "fetch",
+                "origin",
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--recurse-submodules=no",
+                "--filter=blob:none",
+                "--stdin",
+            ],
+            input_text="".join(f"{blob_id}\n" for blob_id in blob_ids),
+        )
+    except subprocess.CalledProcessError as e:
+        # Not fatal, git cat-file will still fetch the blobs one at a time
+        logger.warning(f"Failed to prefetch blobs: {e.stderr}")
+
+
+class GitCatFile:
+    """Long-lived `git cat-file --batch` process for reading blobs without restarting git.
+
+    Usage:
+        with GitCatFile() as catfile:
+            content = catfile.request(sha, "pages/data/amd_response.json")
+    """
+
+    def __init__(self) -> None:
+        """Start the `git cat-file --batch` process in the repository root."""
+        self.proc: subprocess.Popen[bytes] = subprocess.Popen(  # noqa: S603 - arguments are static and executable is resolved
+            [get_git_executable(), "cat-file", "--batch"],
+            cwd=REPO_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.stdin: IO[bytes] = cast("IO[bytes]", self.proc.stdin)
+        self.stdout: IO[bytes] = cast("IO[bytes]", self.proc.stdout)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        self.close()
+
+    def request(self, sha: str, path: str) -> bytes | None:
+        """Return the content of path at commit sha, or None if missing.
+
+        Args:
+            sha: Commit to read the file from.
+            path: Path of the file relative to the repository root (POSIX style).
+
+        Returns:
+            Raw blob content, or None if the path doesn't exist at that commit.
+        """
+        self.stdin.write(f"{sha}:{path}\n".encode())
+        self.stdin.flush()
+
+        # Header is "<oid> <type> <size>", or "<object> missing" if the path doesn't exist
+        header: list[bytes] = self.stdout.readline().split()
+        if len(header) != 3:  # noqa: PLR2004 - oid, type and size
+            return None
+
+        content: bytes = self.stdout.read(int(header[2]))
+        self.stdout.read(1)  # Trailing newline after the blob
+        return content
+
+    def close(self) -> None:
+        """Close stdin so git exits, then wait for the process."""
+        self.stdin.close()
+        self.stdout.close()
+        self.proc.wait()
+
+
+def write_commit_graph() -> None:
+    """Write a commit-graph with changed-path Bloom filters for faster path-limited `git log`.
+
+    With the Bloom filters git can skip commits that didn't touch the path without
+    diffing their trees. Failure only costs speed, so it is logged and ignored.
+    """
+    try:
+        run_git_command(["commit-graph", "write", "--reachable", "--changed-paths"])
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"Failed to write commit-graph: {e.stderr}")
+
+
 def get_commit_history_for_file(rel_path: Path) -> list[tuple[str, int]]:
-    """Return list of (sha, author_unix_ts) for commits touching rel_path."""
+    """Return list of (sha, author_unix_ts) for commits whose diff of rel_path touches a CSV field.
+
+    Uses git's pickaxe (-G) so commits that only changed unrelated fields are
+    filtered out by git instead of being read and parsed.
+    """
     try:
         result: subprocess.CompletedProcess[str] = run_git_command([
             "--no-pager",
             "log",
-            "--follow",
+            f"-G{PICKAXE_PATTERN}",
             "--format=%H|%ct",
+            "--",
             str(rel_path.as_posix()),
         ])
     except subprocess.CalledProcessError as e:
@@ -109,46 +292,124 @@ def get_commit_history_for_file(rel_path: Path) -> list[tuple[str, int]]:
     return commits
 
 
-def get_file_at_commit(sha: str, rel_path: Path) -> str | None:
-    """Return file content at commit sha for rel_path, or None if missing."""
-    try:
-        result: subprocess.CompletedProcess[str] = run_git_command(["show", f"{sha}:{rel_path.as_posix()}"])
-    except subprocess.CalledProcessError:
-        # File may not exist at this commit
-        return None
-    else:
-        return result.stdout
+def stream_commit_blobs(rel_path: Path) -> Iterator[tuple[str, int, bytes]]:
+    """Yield (sha, author_unix_ts, content) for every commit where rel_path's CSV field lines changed.
 
+    Commits are listed with a single `git log` and all blobs are read through one
+    `git cat-file --batch` process, instead of spawning `git show` per commit.
+    In a partial clone the file's blobs are fetched in one batch first. Commits
+    where the file is missing are skipped.
 
-def parse_rows_from_json(json_text: str, commit_ts: int) -> list[CsvRow]:
-    """Parse JSON content into CsvRow list using the given commit timestamp.
+    Args:
+        rel_path: Path of the file relative to the repository root.
+
+    Yields:
+        Tuples of (commit sha, commit timestamp, raw file content), oldest first.
+    """
+    if is_shallow_repository():
+        logger.warning("Repository is a shallow clone, commits before the shallow boundary won't be backfilled (run `git fetch --unshallow` first)")
+
+    write_commit_graph()
+
+    if is_partial_clone():
+        # `git log -G` diffs the blobs, so get them all in one fetch before it faults them in one by one
+        prefetch_blobs(list_blob_ids(rel_path))
+
+    commits: list[tuple[str, int]] = get_commit_history_for_file(rel_path)
+    logger.info(f"Found {len(commits)} commits touching {rel_path}")
+    if not commits:
+        return
+
+    with GitCatFile() as catfile:
+        for sha, ts in commits:
+            content: bytes | None = catfile.request(sha, rel_path.as_posix())
+            if content is None:
+                continue
+            yield sha, ts, content
+
+
+def iter_blobs(rel_path: Path) -> Iterator[tuple[str, int, bytes]]:
+    """Yield (sha, commit_ts, content) for every commit where rel_path's CSV field lines changed, using pygit2.
+
+    Walks HEAD oldest to newest and reads the blob straight out of the object
+    database through libgit2, so no git process is spawned. Commits where the
+    blob is identical to the previous one, or where none of the PICKAXE_FIELDS
+    lines changed (the same filter as `git log -G`), are skipped.
 
     Args:
-        json_text: The JSON string to parse (expected amd_response.json format).
+        rel_path: Path of the file relative to the repository root.
+
+    Yields:
+        Tuples of (commit sha, commit timestamp, raw file content), oldest first.
+
+    Raises:
+        RuntimeError: If pygit2 is not installed.
+    """
+    if not _HAS_PYGIT2:
+        msg = "pygit2 is not installed"
+        raise RuntimeError(msg)
+
+    import pygit2  # noqa: PLC0415 - optional dependency, see _HAS_PYGIT2
+    from pygit2.enums import SortMode  # noqa: PLC0415 - optional dependency, see _HAS_PYGIT2
+
+    repo: pygit2.Repository = pygit2.Repository(str(REPO_ROOT))
+    last_blob_id: pygit2.Oid | None = None
+    last_pickaxe_lines: list[bytes] | None = None
+    for commit in repo.walk(repo.head.target, SortMode.TIME | SortMode.REVERSE):
+        try:
+            blob: pygit2.Object = commit.tree[rel_path.as_posix()]
+        except KeyError:
+            # File doesn't exist at this commit
+            last_blob_id = None
+            last_pickaxe_lines = None
+            continue
+
+        if blob.id == last_blob_id:
+            continue
+        last_blob_id = blob.id
+
+        content: bytes = cast("pygit2.Blob", blob).data
+        pickaxe_lines: list[bytes] = PICKAXE_LINE_RE.findall(content)
+        if pickaxe_lines == last_pickaxe_lines:
+            continue
+        last_pickaxe_lines = pickaxe_lines
+
+        yield str(commit.id), commit.commit_time, content
+
+
+def parse_rows_from_json(json_text: bytes | str, commit_ts: int) -> Iterator[CsvRow]:
+    """Parse JSON content into CSV row tuples using the given commit timestamp.
+
+    Rows are yielded one promotion at a time instead of being collected into a list.
+
+    Args:
+        json_text: The JSON document to parse (expected amd_response.json format).
         commit_ts: Commit author timestamp (seconds since epoch, UTC).
 
-    Returns:
-        A list of CsvRow entries extracted from the JSON at that commit.
+    Yields:
+        Rows (in CSV_COLUMNS order) extracted from the JSON at that commit.
     """
     try:
-        parsed: Any = json.loads(json_text)
-    except json.JSONDecodeError as e:
+        parsed: Any = orjson.loads(json_text)
+    except orjson.JSONDecodeError as e:
         logger.warning(f"Skipping commit due to JSON parse error: {e}")
-        return []
+        return
 
     iso_ts: str = datetime.fromtimestamp(commit_ts, UTC).isoformat()
 
     if not isinstance(parsed, dict):
-        return []
+        return
 
     data: dict[str, Any] = cast("dict[str, Any]", parsed)
     items_obj: Any = data.get("items", [])
     if not isinstance(items_obj, list):
-        return []
+        return
 
     items_list: list[dict[str, Any]] = cast("list[dict[str, Any]]", items_obj)
 
-    rows: list[CsvRow] = []
+    # Plain lookups on the orjson output rather than PromotionsResponse.model_validate_json:
+    # full validation is ~2x slower per snapshot, and older snapshots missing newer
+    # fields would fail it and need this path anyway.
     for item in items_list:
         promotion_id: str | None = item.get("id")
         title: str | None = item.get("title")
@@ -156,17 +417,26 @@ def parse_rows_from_json(json_text: str, commit_ts: int) -> list[CsvRow]:
         keys_available: int | None = item.get("keysAvailable")
         status: str | None = item.get("status")
 
-        rows.append(
-            CsvRow(
-                timestamp=iso_ts,
-                promotion_id=str(promotion_id) if promotion_id is not None else None,
-                title=str(title) if title is not None else None,
-                slug=str(slug) if slug is not None else None,
-                keys_available=int(keys_available) if isinstance(keys_available, int) else None,
-                status=str(status) if status is not None else None,
-            ),
+        yield (
+            iso_ts,
+            str(promotion_id) if promotion_id is not None else None,
+            str(title) if title is not None else None,
+            str(slug) if slug is not None else None,
+            int(keys_available) if isinstance(keys_available, int) else None,
+            str(status) if status is not None else None,
         )
-    return rows
+
+
+def parse_chunk(chunk: tuple[tuple[int, bytes], ...]) -> list[CsvRow]:
+    """Parse a batch of snapshots into CSV rows, run in a worker process.
+
+    Args:
+        chunk: Tuples of (commit timestamp, raw amd_response.json content).
+
+    Returns:
+        Rows for every snapshot in the batch, in input order.
+    """
+    return [row for commit_ts, content in chunk for row in parse_rows_from_json(content, commit_ts)]
 
 
 def read_existing_pairs(csv_path: Path) -> set[tuple[str, str]]:
@@ -178,10 +448,22 @@ def read_existing_pairs(csv_path: Path) -> set[tuple[str, str]]:
     Returns:
         A set of (timestamp, promotion_id) tuples already present in the CSV.
     """
-    pairs: set[tuple[str, str]] = set()
     if not csv_path.exists():
-        return pairs
+        return set()
 
+    if _HAS_PANDAS:
+        import pandas as pd  # noqa: PLC0415 - optional dependency, see _HAS_PANDAS
+
+        # Only tokenize the two columns we need; keep empty cells as "" instead of NaN
+        try:
+            df: pd.DataFrame = pd.read_csv(csv_path, usecols=["timestamp", "promotion_id"], dtype=str, engine="c", keep_default_na=False)
+        except (pd.errors.EmptyDataError, ValueError) as e:
+            # Empty file or missing columns, the csv module below handles both
+            logger.debug(f"pandas couldn't read {csv_path}, falling back to the csv module: {e}")
+        else:
+            return {(ts, pid) for ts, pid in zip(df["timestamp"].tolist(), df["promotion_id"].tolist(), strict=True) if ts and pid}
+
+    pairs: set[tuple[str, str]] = set()
     with csv_path.open(encoding="utf-8") as f:
         reader: csv.DictReader[str] = csv.DictReader(f)
         for row in reader:
@@ -192,65 +474,135 @@ def read_existing_pairs(csv_path: Path) -> set[tuple[str, str]]:
     return pairs
 
 
-def append_rows(csv_path: Path, rows: list[CsvRow]) -> int:
-    """Append rows to CSV, writing header if needed.
+def get_pairs_cache_path(csv_path: Path) -> Path:
+    """Return the sidecar file caching the (timestamp, promotion_id) pairs of csv_path."""
+    return csv_path.with_suffix(".pairs.pkl")
+
+
+def save_pairs_cache(csv_path: Path, pairs: set[tuple[str, str]]) -> None:
+    """Cache pairs next to csv_path, keyed by the CSV's current mtime and size.
+
+    Pairs with an empty timestamp or promotion_id are left out, like read_existing_pairs
+    does, so a cached set dedups the same way as one read from the CSV.
+
+    Args:
+        csv_path: Path to the CSV file the pairs were read from.
+        pairs: The (timestamp, promotion_id) pairs present in the CSV.
+    """
+    cached_pairs: set[tuple[str, str]] = {(ts, pid) for ts, pid in pairs if ts and pid}
+    stat: os.stat_result = csv_path.stat()
+    try:
+        with get_pairs_cache_path(csv_path).open("wb") as f:
+            pickle.dump(((stat.st_mtime_ns, stat.st_size), cached_pairs), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Failed to save pairs cache: {e}")
+
+
+def load_existing_pairs(csv_path: Path) -> set[tuple[str, str]]:
+    """Return existing (timestamp, promotion_id) pairs, using the sidecar cache when fresh.
+
+    The cache is only used if the CSV's mtime and size match what was recorded,
+    otherwise the CSV is re-read and the cache rebuilt.
 
     Args:
-        csv_path: Path to the CSV file to append to.
-        rows: Rows to write.
+        csv_path: Path to the existing CSV file if present.
 
     Returns:
-        The number of rows successfully written.
+        A set of (timestamp, promotion_id) tuples already present in the CSV.
     """
-    if not rows:
-        return 0
+    if not csv_path.exists():
+        return set()
 
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    exists: bool = csv_path.exists()
+    stat: os.stat_result = csv_path.stat()
+    try:
+        with get_pairs_cache_path(csv_path).open("rb") as f:
+            cache_key, pairs = pickle.load(f)  # noqa: S301 - local cache written by save_pairs_cache
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError) as e:
+        logger.warning(f"Ignoring unreadable pairs cache: {e}")
+    else:
+        if cache_key == (stat.st_mtime_ns, stat.st_size):
+            return pairs
+
+    pairs = read_existing_pairs(csv_path)
+    save_pairs_cache(csv_path, pairs)
+    return pairs
 
-    with csv_path.open("a", newline="", encoding="utf-8") as f:
-        fieldnames: list[str] = ["timestamp", "promotion_id", "title", "slug", "keys_available", "status"]
-        writer: csv.DictWriter[str] = csv.DictWriter(f, fieldnames=fieldnames)
-        if not exists:
-            writer.writeheader()
-        for r in rows:
-            writer.writerow(r.as_dict())
-    return len(rows)
 
+def drop_existing_rows(rows: list[CsvRow], existing_pairs: set[tuple[str, str]]) -> list[CsvRow]:
+    """Return rows whose (timestamp, promotion_id) pair isn't in existing_pairs, recording them.
+
+    Args:
+        rows: Candidate rows parsed from a batch of snapshots.
+        existing_pairs: Pairs already in the CSV, updated in place with the returned rows.
 
-def main() -> None:
-    """Backfill the keys availability CSV using git history snapshots."""
+    Returns:
+        The rows that still need to be written.
+    """
+    new_rows: list[CsvRow] = []
+    for row in rows:
+        key: tuple[str, str] = (row[0], row[1] or "")
+        if key in existing_pairs:
+            continue
+        new_rows.append(row)
+        existing_pairs.add(key)
+    return new_rows
+
+
+def main(*, use_git_cli: bool = False) -> None:
+    """Backfill the keys availability CSV using git history snapshots.
+
+    Rows are appended as each batch of snapshots is parsed. Commits arrive oldest
+    to newest, so the CSV stays sorted by timestamp without buffering every row.
+
+    Args:
+        use_git_cli: Read history through the git CLI even if pygit2 is installed.
+    """
     logger.info("Starting backfill from git history")
 
     rel_json: Path = JSON_REL_PATH
-    rel_csv: Path = CSV_REL_PATH
+    csv_path: Path = REPO_ROOT / CSV_REL_PATH
 
-    commits: list[tuple[str, int]] = get_commit_history_for_file(rel_json)
-    logger.info(f"Found {len(commits)} commits touching {rel_json}")
-
-    existing_pairs: set[tuple[str, str]] = read_existing_pairs(REPO_ROOT / rel_csv)
+    existing_pairs: set[tuple[str, str]] = load_existing_pairs(csv_path)
     logger.info(f"Loaded {len(existing_pairs)} existing (timestamp,promotion_id) pairs")
 
-    new_rows: list[CsvRow] = []
+    if not use_git_cli and _HAS_PYGIT2 and is_partial_clone():
+        logger.info("Partial clone detected, reading history with the git CLI so missing blobs can be fetched")
+        use_git_cli = True
 
-    for sha, ts in commits:
-        content: str | None = get_file_at_commit(sha, rel_json)
-        if content is None:
-            continue
-        rows: list[CsvRow] = parse_rows_from_json(content, ts)
-        for r in rows:
-            key: tuple[str, str] = (r.timestamp, r.promotion_id or "")
-            if key in existing_pairs:
-                continue
-            new_rows.append(r)
-            existing_pairs.add(key)
+    if use_git_cli or not _HAS_PYGIT2:
+        blobs: Iterator[tuple[str, int, bytes]] = stream_commit_blobs(rel_json)
+    else:
+        logger.info("Reading git history with pygit2")
+        blobs = iter_blobs(rel_json)
+
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    write_header: bool = not csv_path.exists()
+    written: int = 0
+
+    # git reading stays in this process, JSON parsing is spread over worker processes
+    snapshots: Iterator[tuple[int, bytes]] = ((ts, content) for _sha, ts, content in blobs)
+    workers: int = os.process_cpu_count() or 1
+    with csv_path.open("a", newline="", encoding="utf-8") as f, ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(CSV_COLUMNS)
+
+        for rows in executor.map(parse_chunk, batched(snapshots, PARSE_CHUNK_SIZE, strict=False), buffersize=workers * 2):
+            new_rows: list[CsvRow] = drop_existing_rows(rows, existing_pairs)
+            writer.writerows(new_rows)
+            written += len(new_rows)
 
-    # Sort rows by timestamp ascending for stable CSV
-    new_rows.sort(key=lambda r: r.timestamp)
+    # The CSV changed, so refresh the cache with the pairs we know are now in it
+    if written:
+        save_pairs_cache(csv_path, existing_pairs)
 
-    written: int = append_rows(REPO_ROOT / rel_csv, new_rows)
-    logger.success(f"Backfill complete. Appended {written} rows to {rel_csv}")
+    logger.success(f"Backfill complete. Appended {written} rows to {CSV_REL_PATH}")
 
 
 if __name__ == "__main__":
-    main()
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Backfill keys availability CSV from git history.")
+    parser.add_argument("--git-cli", action="store_true", help="Read history through the git CLI instead of pygit2")
+    args: argparse.Namespace = parser.parse_args()
+    main(use_git_cli=args.git_cli)
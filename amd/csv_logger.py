@@ -1,13 +1,15 @@
 """CSV logger for tracking AMD Gaming promotion key availability over time."""
 
 import csv
-import json
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from loguru import logger
 
+CSV_COLUMNS: tuple[str, ...] = ("timestamp", "promotion_id", "title", "slug", "keys_available", "status")
+
 
 def append_keys_data_to_csv(json_path: Path, csv_path: Path) -> None:
     """Append current keysAvailable data to CSV file.
@@ -17,23 +19,14 @@ def append_keys_data_to_csv(json_path: Path, csv_path: Path) -> None:
         csv_path: Path to the keys_available.csv file
     """
     # Read JSON data
-    with json_path.open(encoding="utf-8") as f:
-        data: dict[str, list[dict[str, str]]] = json.load(f)
+    data: dict[str, list[dict[str, str]]] = orjson.loads(json_path.read_bytes())
 
     # Get current timestamp
     timestamp: str = datetime.now(UTC).isoformat()
 
-    # Prepare rows to append
-    rows: list[dict[str, str | None]] = [
-        {
-            "timestamp": timestamp,
-            "promotion_id": item.get("id"),
-            "title": item.get("title"),
-            "slug": item.get("slug"),
-            "keys_available": item.get("keysAvailable"),
-            "status": item.get("status"),
-        }
-        for item in data.get("items", [])
+    # Prepare rows to append, in CSV_COLUMNS order
+    rows: list[tuple[str, str | None, str | None, str | None, str | None, str | None]] = [
+        (timestamp, item.get("id"), item.get("title"), item.get("slug"), item.get("keysAvailable"), item.get("status")) for item in data.get("items", [])
     ]
 
     # Check if CSV exists
@@ -41,12 +34,11 @@ def append_keys_data_to_csv(json_path: Path, csv_path: Path) -> None:
 
     # Append to CSV
     with csv_path.open("a", newline="", encoding="utf-8") as f:
-        fieldnames: list[str] = ["timestamp", "promotion_id", "title", "slug", "keys_available", "status"]
-        writer: csv.DictWriter[str] = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.writer(f)
 
         # Write header if file doesn't exist
         if not csv_exists:
-            writer.writeheader()
+            writer.writerow(CSV_COLUMNS)
 
         writer.writerows(rows)
 
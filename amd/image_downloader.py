@@ -1,12 +1,27 @@
 """Image downloader utility for AMD Gaming promotions."""
 
+import asyncio
+import os
 from pathlib import Path
-from urllib.parse import ParseResult
-from urllib.parse import urlparse
 
 from curl_cffi import requests
 from loguru import logger
 
+# Image extensions kept as-is, anything else is saved as .jpg
+ALLOWED_EXTENSIONS: frozenset[str] = frozenset({"jpg", "jpeg", "png", "gif", "webp"})
+
+IMAGE_HEADERS: dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:145.0) Gecko/20100101 Firefox/145.0",
+    "Accept": "image/avif,image/webp,image/png,image/svg+xml,image/*;q=0.8,*/*;q=0.5",
+    "Accept-Language": "en-US,en;q=0.7,sv;q=0.3",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+    "Sec-Fetch-Site": "cross-site",
+}
+
 
 class ImageDownloader:
     """Download and cache promotion images to serve from GitHub Pages."""
@@ -19,7 +34,32 @@ class ImageDownloader:
         """
         self.output_dir: Path = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session: requests.Session[requests.Response] = requests.Session()
+
+        # Filenames already in output_dir, listed once instead of a stat() per image
+        with os.scandir(self.output_dir) as entries:
+            self.existing_files: set[str] = {entry.name for entry in entries}
+
+    def get_image_path(self, image_url: str, promotion_id: str) -> Path:
+        """Return the local path an image is (or will be) saved to.
+
+        Args:
+            image_url: URL of the image
+            promotion_id: Unique promotion ID to use in filename
+
+        Returns:
+            Path inside the output directory named after the promotion ID and image extension
+        """
+        # Extract file extension from the URL path (without query string or fragment)
+        url_path: str = image_url.split("?", 1)[0].split("#", 1)[0]
+        extension: str = os.path.splitext(url_path)[1][1:].lower()  # noqa: PTH122 - URL, not a filesystem path
+
+        # Sanitize extension (only allow common image formats)
+        if extension not in ALLOWED_EXTENSIONS:
+            extension = "jpg"
+
+        # Create filename: promotion-id.extension
+        filename: str = f"{promotion_id}.{extension}"
+        return self.output_dir / filename
 
     def download_image(self, image_url: str, promotion_id: str) -> Path | None:
         """Download an image and save it locally.
@@ -31,46 +71,34 @@ class ImageDownloader:
         Returns:
             Path to the downloaded image file, or None if download failed
         """
-        if not image_url:
-            logger.warning(f"Empty image URL for promotion {promotion_id}")
-            return None
+        return self.download_many([(image_url, promotion_id)], max_workers=1)[promotion_id]
 
-        # Extract file extension from URL
-        parsed_url: ParseResult = urlparse(image_url)
-        path_parts: list[str] = parsed_url.path.split(".")
-        extension: str = path_parts[-1].lower() if len(path_parts) > 1 else "jpg"
+    async def download_image_async(self, session: requests.AsyncSession[requests.Response], image_url: str, promotion_id: str) -> Path | None:
+        """Download an image through an async session and save it locally.
 
-        # Sanitize extension (only allow common image formats)
-        if extension not in {"jpg", "jpeg", "png", "gif", "webp"}:
-            extension = "jpg"
+        Args:
+            session: Session shared by all concurrent downloads
+            image_url: URL of the image to download
+            promotion_id: Unique promotion ID to use in filename
 
-        # Create filename: promotion-id.extension
-        filename: str = f"{promotion_id}.{extension}"
-        output_path: Path = self.output_dir / filename
+        Returns:
+            Path to the downloaded image file, or None if download failed
+        """
+        if not image_url:
+            logger.warning(f"Empty image URL for promotion {promotion_id}")
+            return None
 
         # Skip if already downloaded
-        if output_path.exists():
-            logger.debug(f"Image already exists: {output_path}")
-            return output_path
+        if existing_path := self._get_existing_image_path(image_url, promotion_id):
+            return existing_path
+
+        output_path: Path = self.get_image_path(image_url, promotion_id)
 
         try:
             logger.info(f"Downloading image from {image_url}")
-
-            headers: dict[str, str] = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:145.0) Gecko/20100101 Firefox/145.0",
-                "Accept": "image/avif,image/webp,image/png,image/svg+xml,image/*;q=0.8,*/*;q=0.5",
-                "Accept-Language": "en-US,en;q=0.7,sv;q=0.3",
-                "Accept-Encoding": "gzip, deflate, br, zstd",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "image",
-                "Sec-Fetch-Mode": "no-cors",
-                "Sec-Fetch-Site": "cross-site",
-            }
-
-            response: requests.Response = self.session.get(
+            response: requests.Response = await session.get(
                 url=image_url,
-                headers=headers,
+                headers=IMAGE_HEADERS,
                 impersonate="firefox",
                 timeout=30,
             )
@@ -80,10 +108,87 @@ class ImageDownloader:
             logger.error(f"Failed to download image from {image_url}: {e}")
             return None
         else:
-            # Save image to file
-            output_path.write_bytes(response.content)  # pyright: ignore[reportUnknownMemberType]
-            logger.success(f"Downloaded image to {output_path}")
-            return output_path
+            return self._save_image(output_path, response.content)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+
+    def _get_existing_image_path(self, image_url: str, promotion_id: str) -> Path | None:
+        """Return the image's local path if it has already been downloaded.
+
+        Args:
+            image_url: URL of the image
+            promotion_id: Unique promotion ID used in the filename
+
+        Returns:
+            Path to the existing image file, or None if it still needs downloading
+        """
+        if not image_url:
+            return None
+
+        output_path: Path = self.get_image_path(image_url, promotion_id)
+        if output_path.name not in self.existing_files:
+            return None
+
+        logger.debug(f"Image already exists: {output_path}")
+        return output_path
+
+    def _save_image(self, output_path: Path, content: bytes) -> Path:
+        """Write downloaded image content to output_path and remember it as existing.
+
+        Args:
+            output_path: Path to write the image to
+            content: Image bytes
+
+        Returns:
+            output_path
+        """
+        output_path.write_bytes(content)
+        self.existing_files.add(output_path.name)
+        logger.success(f"Downloaded image to {output_path}")
+        return output_path
+
+    async def _download_all(self, images: list[tuple[str, str]], max_workers: int) -> list[Path | None]:
+        """Download images concurrently over one async session.
+
+        Args:
+            images: (image_url, promotion_id) pairs to download
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Downloaded image paths (or None on failure), in the same order as images
+        """
+        async with requests.AsyncSession(max_clients=max_workers) as session:
+            return await asyncio.gather(*(self.download_image_async(session, image_url, promotion_id) for image_url, promotion_id in images))
+
+    def download_many(self, images: list[tuple[str, str]], max_workers: int = 8) -> dict[str, Path | None]:
+        """Download several images concurrently.
+
+        Images that already exist are resolved up front, only the missing ones are
+        downloaded. Those share one curl_cffi AsyncSession, whose connection pool
+        reuses connections (and HTTP/2 streams) to the same host instead of doing a
+        TLS handshake per download.
+
+        Args:
+            images: (image_url, promotion_id) pairs to download
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Mapping of promotion ID to the downloaded image path, or None if the download failed
+        """
+        results: dict[str, Path | None] = {}
+        pending: list[tuple[str, str]] = []
+        for image_url, promotion_id in images:
+            if existing_path := self._get_existing_image_path(image_url, promotion_id):
+                results[promotion_id] = existing_path
+            else:
+                pending.append((image_url, promotion_id))
+
+        if not pending:
+            return results
+
+        downloaded: list[Path | None] = asyncio.run(self._download_all(pending, max_workers))
+        for (_, promotion_id), local_path in zip(pending, downloaded, strict=True):
+            results[promotion_id] = local_path
+
+        return results
 
     def get_github_pages_url(self, local_path: Path | None, base_url: str = "https://thelovinator1.github.io/rss-feeds") -> str | None:
         """Convert local image path to GitHub Pages URL.
@@ -95,7 +200,12 @@ class ImageDownloader:
         Returns:
             Full GitHub Pages URL for the image, or None if image unavailable
         """
-        if not local_path or not local_path.exists():
+        if not local_path:
+            return None
+
+        # Images in output_dir are looked up in the cached listing, anything else needs a stat()
+        in_output_dir: bool = local_path.parent == self.output_dir and local_path.name in self.existing_files
+        if not in_output_dir and not local_path.exists():
             return None
 
         # Convert path relative to pages/ directory
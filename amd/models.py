@@ -2,9 +2,11 @@
 
 from datetime import UTC
 from datetime import datetime
+from typing import override
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 
 
 class PromotionItem(BaseModel):
@@ -38,6 +40,14 @@ class PromotionItem(BaseModel):
     # Local image path (set after downloading)
     local_image_path: str | None = None
 
+    # feed_pub_date, built once after validation (private attributes are left out of model_dump)
+    _feed_pub_date: datetime = PrivateAttr()
+
+    @override
+    def model_post_init(self, context: object, /) -> None:
+        """Build the feed publication date once created_at has been validated."""
+        self._feed_pub_date = datetime.fromtimestamp(self.created_at, tz=UTC)
+
     # FeedItem protocol implementation
     @property
     def feed_id(self) -> str:
@@ -57,7 +67,7 @@ class PromotionItem(BaseModel):
     @property
     def feed_pub_date(self) -> datetime:
         """Publication date of the feed item (timezone-aware)."""
-        return datetime.fromtimestamp(self.created_at, tz=UTC)
+        return self._feed_pub_date
 
     @property
     def feed_category(self) -> str | None:
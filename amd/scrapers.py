@@ -1,15 +1,20 @@
 """Scrapers for fetching AMD Gaming promotional data."""
 
-import json
+from http import HTTPStatus
 from pathlib import Path
-from typing import Any
 from typing import LiteralString
 
+import orjson
 from curl_cffi import requests
 from loguru import logger
 
 from amd.models import PromotionsResponse
 
+# Where the raw API response and its ETag are kept between runs (committed by the workflow)
+DATA_DIR: Path = Path("pages/data")
+RESPONSE_FILENAME: LiteralString = "amd_response.json"
+ETAG_FILENAME: LiteralString = ".amd_response.etag"
+
 
 class AMDGamingScraper:
     """Scraper for AMD Gaming promotions and giveaways.
@@ -29,8 +34,12 @@ class AMDGamingScraper:
     def fetch_promotions(self, *, save_response: bool = True) -> PromotionsResponse:
         """Fetch all active promotions from AMD Gaming.
 
+        Sends the ETag of the last saved response as If-None-Match. If the server
+        answers 304 Not Modified, the saved response is used instead of
+        downloading and parsing the same payload again.
+
         Args:
-            save_response: Whether to save the raw API response for git tracking (default: True)
+            save_response: Whether to save the raw API response (and its ETag) for git tracking (default: True)
 
         Returns:
             PromotionsResponse containing list of promotion items
@@ -51,41 +60,90 @@ class AMDGamingScraper:
             "Sec-Fetch-Site": "same-origin",
         }
 
+        cached_response_path: Path = DATA_DIR / RESPONSE_FILENAME
+        etag: str | None = self.load_etag()
+        if etag and cached_response_path.exists():
+            headers["If-None-Match"] = etag
+
         logger.info(f"Fetching promotions from {url}")
 
         response: requests.Response = self.session.get(url, headers=headers, impersonate="firefox")
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.info(f"Promotions not modified since last fetch, using {cached_response_path}")
+            return PromotionsResponse.model_validate_json(cached_response_path.read_bytes())
+
         response.raise_for_status()
 
-        response_data: dict[str, Any] = response.json()  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+        response_content: bytes = response.content  # pyright: ignore[reportUnknownMemberType]
+
+        # Validate straight from the JSON bytes, without building an intermediate dict.
+        # This happens before saving so a malformed body is never cached alongside its ETag.
+        result: PromotionsResponse = PromotionsResponse.model_validate_json(response_content)
+        logger.info(f"Successfully fetched {len(result.items)} promotions")
 
         # Save raw response for git history tracking
         if save_response:
-            self.save_response(response_data)  # pyright: ignore[reportUnknownArgumentType]
-
-        result: PromotionsResponse = PromotionsResponse.model_validate(response_data)
-        logger.info(f"Successfully fetched {len(result.items)} promotions")
+            self.save_response(response_content)
+            self.save_etag(response.headers.get("etag"))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
 
         return result
 
-    def save_response(self, response_data: dict[str, Any], output_dir: Path = Path("pages/data")) -> Path:
+    def save_response(self, response_content: bytes, output_dir: Path = DATA_DIR) -> Path:
         """Save raw API response to a file for git history tracking.
 
+        The JSON is re-serialized with sorted keys and indentation so that git
+        diffs between runs stay readable. The file is only written if the
+        serialized content differs from what is already on disk.
+
         Args:
-            response_data: The raw JSON response from the API
+            response_content: The raw JSON response body from the API
             output_dir: Directory to save the response file (default: pages/data/)
 
         Returns:
             Path to the saved file
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        filename: Path = output_dir / "amd_response.json"
+        filename: Path = output_dir / RESPONSE_FILENAME
+
+        formatted: bytes = orjson.dumps(orjson.loads(response_content), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+        # Leave the file (and its mtime) alone if the response hasn't changed
+        if filename.exists() and filename.read_bytes() == formatted:
+            logger.info(f"API response unchanged, not rewriting {filename}")
+            return filename
 
-        with filename.open("w", encoding="utf-8") as f:
-            json.dump(response_data, f, indent=4, ensure_ascii=False, sort_keys=True)
+        filename.write_bytes(formatted)
 
         logger.info(f"Saved API response to {filename}")
         return filename
 
+    def load_etag(self, output_dir: Path = DATA_DIR) -> str | None:
+        """Load the ETag of the last saved API response.
+
+        Args:
+            output_dir: Directory the ETag file is stored in (default: pages/data/)
+
+        Returns:
+            The ETag, or None if there is none
+        """
+        etag_path: Path = output_dir / ETAG_FILENAME
+        if not etag_path.exists():
+            return None
+        return etag_path.read_text(encoding="utf-8").strip() or None
+
+    def save_etag(self, etag: str | None, output_dir: Path = DATA_DIR) -> None:
+        """Save the ETag of the saved API response, or remove a stale one if the server sent none.
+
+        Args:
+            etag: ETag header of the response, if any
+            output_dir: Directory to save the ETag file in (default: pages/data/)
+        """
+        etag_path: Path = output_dir / ETAG_FILENAME
+        if etag:
+            etag_path.write_text(etag + "\n", encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+
 
 if __name__ == "__main__":
     scraper: AMDGamingScraper = AMDGamingScraper()
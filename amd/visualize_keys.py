@@ -9,9 +9,9 @@ Usage:
 # ruff: noqa: T201
 
 import csv
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
 
 
 def print_summary() -> None:
@@ -22,46 +22,40 @@ def print_summary() -> None:
         print(f"CSV file not found: {csv_path}")
         return
 
+    # Group by promotion, parsing each row once into (timestamp, keys, title, slug)
+    promotions: defaultdict[str, list[tuple[datetime, int, str, str]]] = defaultdict(list)
+    record_count: int = 0
     with csv_path.open(encoding="utf-8") as f:
         reader: csv.DictReader[str] = csv.DictReader(f)
-        rows: list[dict[str | Any, str | Any]] = list(reader)
+        for row in reader:
+            promotions[row["promotion_id"]].append((datetime.fromisoformat(row["timestamp"]), int(row["keys_available"]), row["title"], row["slug"]))
+            record_count += 1
 
-    if not rows:
+    if not record_count:
         print("No data in CSV file")
         return
 
-    print(f"\n📊 Key Availability Summary ({len(rows)} records)\n")
+    print(f"\n📊 Key Availability Summary ({record_count} records)\n")
     print("=" * 80)
 
-    # Group by promotion
-    promotions: dict[str, list[dict[str, Any]]] = {}
-    for row in rows:
-        promo_id: str = row["promotion_id"]
-        if promo_id not in promotions:
-            promotions[promo_id] = []
-        promotions[promo_id].append(row)
-
     # Print stats for each promotion
     for records in promotions.values():
-        title: str = records[0]["title"]
-        slug: str = records[0]["slug"]
-
-        # Get key availability over time
-        timestamps: list[datetime] = [datetime.fromisoformat(r["timestamp"]) for r in records]
-        keys: list[int] = [int(r["keys_available"]) for r in records]
+        _, _, title, slug = records[0]
+        first_keys: int = records[0][1]
+        last_keys: int = records[-1][1]
 
         print(f"\n🎮 {title}")
         print(f"   Slug: {slug}")
         print(f"   Records: {len(records)}")
-        print(f"   Latest keys available: {keys[-1]:,}")
+        print(f"   Latest keys available: {last_keys:,}")
 
-        if len(keys) > 1:
-            key_change: int = keys[-1] - keys[0]
+        if len(records) > 1:
+            key_change: int = last_keys - first_keys
             print(f"   Change since first record: {key_change:+,}")
 
             # Show timeline if we have multiple records
             print("\n   Timeline:")
-            for ts, key_count in zip(timestamps[-5:], keys[-5:], strict=False):  # Show last 5 records
+            for ts, key_count, _, _ in records[-5:]:  # Show last 5 records
                 print(f"   • {ts.strftime('%Y-%m-%d %H:%M')} UTC: {key_count:,} keys")
 
     print("\n" + "=" * 80)
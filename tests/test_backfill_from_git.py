@@ -0,0 +1,138 @@
+import os
+import subprocess  # noqa: S404 - builds a throwaway git repository for the history tests
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+import pytest
+
+from amd import backfill_from_git
+from amd.backfill_from_git import JSON_REL_PATH
+from amd.backfill_from_git import GitCatFile
+from amd.backfill_from_git import get_git_executable
+from amd.backfill_from_git import iter_blobs
+from amd.backfill_from_git import load_existing_pairs
+from amd.backfill_from_git import read_existing_pairs
+from amd.backfill_from_git import save_pairs_cache
+from amd.backfill_from_git import stream_commit_blobs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CSV_READERS = [
+    pytest.param(True, id="pandas", marks=pytest.mark.skipif(find_spec("pandas") is None, reason="pandas is not installed")),
+    pytest.param(False, id="csv"),
+]
+
+
+@pytest.mark.parametrize("use_pandas", CSV_READERS)
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param("", set[tuple[str, str]](), id="empty-file"),
+        pytest.param("a,b\n1,2\n", set[tuple[str, str]](), id="other-columns"),
+        pytest.param("timestamp,promotion_id,title\n", set[tuple[str, str]](), id="header-only"),
+        pytest.param(
+            "timestamp,promotion_id,title\nt1,p1,A\nt1,,B\n,p2,C\nt2,p2,D\n",
+            {("t1", "p1"), ("t2", "p2")},
+            id="rows",
+        ),
+    ],
+)
+def test_read_existing_pairs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, use_pandas: bool, content: str, expected: set[tuple[str, str]]) -> None:
+    """Test that both CSV readers return the same pairs, including for files pandas can't parse."""
+    monkeypatch.setattr(backfill_from_git, "_HAS_PANDAS", use_pandas)
+    csv_path = tmp_path / "keys.csv"
+    csv_path.write_text(content, encoding="utf-8")
+    assert read_existing_pairs(csv_path) == expected
+
+
+def test_pairs_cache_reused_until_csv_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the sidecar cache is used while the CSV's mtime and size match, and rebuilt after an append."""
+    reads: list[Path] = []
+
+    def counting_read(csv_path: Path) -> set[tuple[str, str]]:
+        reads.append(csv_path)
+        return read_existing_pairs(csv_path)
+
+    monkeypatch.setattr(backfill_from_git, "read_existing_pairs", counting_read)
+    csv_path = tmp_path / "keys.csv"
+    csv_path.write_text("timestamp,promotion_id\nt1,p1\n", encoding="utf-8")
+
+    assert load_existing_pairs(csv_path) == {("t1", "p1")}
+    assert load_existing_pairs(csv_path) == {("t1", "p1")}
+    assert len(reads) == 1
+
+    with csv_path.open("a", encoding="utf-8") as f:
+        f.write("t2,p2\n")
+    assert load_existing_pairs(csv_path) == {("t1", "p1"), ("t2", "p2")}
+    assert len(reads) == 2
+
+
+def test_pairs_cache_matches_csv(tmp_path: Path) -> None:
+    """Test that pairs without a promotion_id aren't cached, since reading the CSV never returns them."""
+    csv_path = tmp_path / "keys.csv"
+    csv_path.write_text("timestamp,promotion_id\nt1,p1\nt1,\n", encoding="utf-8")
+
+    save_pairs_cache(csv_path, {("t1", "p1"), ("t1", "")})
+    assert load_existing_pairs(csv_path) == read_existing_pairs(csv_path) == {("t1", "p1")}
+
+
+def snapshot(color: str, status: str) -> bytes:
+    """Return an amd_response.json snapshot, pretty-printed like the saved response."""
+    return (
+        "{\n"
+        '    "items": [\n'
+        "        {\n"
+        f'            "color": "{color}",\n'
+        '            "id": "p1",\n'
+        '            "keysAvailable": 5,\n'
+        '            "slug": "game",\n'
+        f'            "status": "{status}",\n'
+        '            "title": "Game"\n'
+        "        }\n"
+        "    ]\n"
+        "}\n"
+    ).encode()
+
+
+def commit(repo: Path, content: bytes | None, commit_ts: int) -> str:
+    """Write (or delete, if content is None) amd_response.json in repo and commit it at commit_ts.
+
+    Returns:
+        The new commit's sha
+    """
+    json_path: Path = repo / JSON_REL_PATH
+    if content is None:
+        json_path.unlink()
+    else:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_bytes(content)
+
+    env: dict[str, str] = {**os.environ, "GIT_AUTHOR_DATE": f"@{commit_ts} +0000", "GIT_COMMITTER_DATE": f"@{commit_ts} +0000"}
+    git: list[str] = [get_git_executable(), "-c", "user.name=Test", "-c", "user.email=test@example.com", "-c", "commit.gpgsign=false"]
+    subprocess.run([*git, "add", "--all"], cwd=repo, env=env, check=True)  # noqa: S603 - static arguments
+    subprocess.run([*git, "commit", "--quiet", "--message", f"Snapshot at {commit_ts}"], cwd=repo, env=env, check=True)  # noqa: S603 - static arguments
+    return subprocess.run([*git, "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()  # noqa: S603 - static arguments
+
+
+def test_history_readers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test which snapshots the git CLI reader yields, and that the pygit2 reader yields the same ones."""
+    subprocess.run([get_git_executable(), "init", "--quiet", str(tmp_path)], check=True)  # noqa: S603 - static arguments
+    monkeypatch.setattr(backfill_from_git, "REPO_ROOT", tmp_path)
+
+    active: bytes = snapshot("#fff", "active")
+    expired: bytes = snapshot("#000", "expired")
+    commit(tmp_path, active, 1_700_000_000)
+    commit(tmp_path, snapshot("#000", "active"), 1_700_000_100)  # Only an unrelated field changed
+    commit(tmp_path, expired, 1_700_000_200)  # Only status changed
+    deleted_sha: str = commit(tmp_path, None, 1_700_000_300)
+    commit(tmp_path, expired, 1_700_000_400)  # Re-added with the content it had before the delete
+
+    expected: list[tuple[int, bytes]] = [(1_700_000_000, active), (1_700_000_200, expired), (1_700_000_400, expired)]
+    assert [(ts, content) for _sha, ts, content in stream_commit_blobs(JSON_REL_PATH)] == expected
+    if find_spec("pygit2") is not None:
+        assert [(ts, content) for _sha, ts, content in iter_blobs(JSON_REL_PATH)] == expected
+
+    with GitCatFile() as catfile:
+        assert catfile.request(deleted_sha, JSON_REL_PATH.as_posix()) is None
+        assert catfile.request("HEAD", JSON_REL_PATH.as_posix()) == expired
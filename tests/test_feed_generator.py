@@ -0,0 +1,94 @@
+import io
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import cast
+from xml.etree import ElementTree as ET  # noqa: S405 - parses feeds generated by the test itself
+
+from feed_generator import RSSFeedGenerator
+from feed_generator import select_feed_items
+
+if TYPE_CHECKING:
+    from feed_generator import FeedItem
+
+# Characters that need escaping in element text, a CDATA terminator and Windows line endings
+NASTY_TEXT = 'Tom & Jerry <b>"quoted"</b> ]]> end\r\nnext line'
+
+
+@dataclass
+class Item:
+    feed_id: str
+    feed_title: str
+    feed_link: str
+    feed_pub_date: datetime
+    feed_category: str | None
+    content: str
+
+
+@dataclass
+class Collection:
+    items: list[Item]
+
+
+def make_item(index: int, text: str = "") -> Item:
+    return Item(
+        feed_id=f"id-{index} {text}",
+        feed_title=f"Title {index} {text}",
+        feed_link=f"https://example.com/?a={index}&b=<{text}>",
+        feed_pub_date=datetime(2025, 1, 1, tzinfo=UTC) + timedelta(days=index),
+        feed_category=f"Tags {text}" if text else None,
+        content=f"<p>{text}</p>",
+    )
+
+
+def build_description(item: FeedItem) -> str:
+    return cast("Item", item).content
+
+
+def render(items: list[Item], max_items: int | None = None) -> ET.Element:
+    generator = RSSFeedGenerator(channel_title=f"Feed {NASTY_TEXT}", channel_link="https://example.com/?a=1&b=2", channel_description=NASTY_TEXT)
+    buffer = io.BytesIO()
+    generator.generate_feed(Collection(items), build_description, buffer, datetime(2025, 11, 17, 10, 37, 41, tzinfo=UTC), max_items=max_items)
+    return ET.fromstring(buffer.getvalue())  # noqa: S314 - parses feeds generated by the test itself
+
+
+def test_special_characters_round_trip() -> None:
+    """Test that text with XML special characters, ]]> and CRLF parses back to the original values."""
+    items = [make_item(1, NASTY_TEXT), make_item(2)]
+    channel = render(items).find("channel")
+    assert channel is not None
+    assert channel.findtext("title") == f"Feed {NASTY_TEXT}"
+    assert channel.findtext("link") == "https://example.com/?a=1&b=2"
+    assert channel.findtext("description") == NASTY_TEXT
+    assert channel.findtext("lastBuildDate") == "Mon, 17 Nov 2025 10:37:41 +0000"
+
+    elements = channel.findall("item")
+    assert len(elements) == len(items)
+    for element, item in zip(elements, items, strict=True):
+        assert element.findtext("title") == item.feed_title
+        assert element.findtext("link") == item.feed_link
+        assert element.findtext("guid") == item.feed_id
+        assert element.findtext("pubDate") == item.feed_pub_date.strftime("%a, %d %b %Y %H:%M:%S %z")
+        assert element.findtext("category") == item.feed_category
+        # CDATA can't carry a lone \r, XML parsers read it back as \n
+        assert element.findtext("description") == item.content.replace("\r\n", "\n")
+
+
+def test_max_items_keeps_newest() -> None:
+    """Test that a feed over the cap keeps the newest items, in the collection's order."""
+    items = [make_item(index) for index in (3, 0, 4, 1, 2)]
+    guids = [guid.text for guid in render(items, max_items=3).iter("guid")]
+    assert guids == ["id-3 ", "id-4 ", "id-2 "]
+    assert list(select_feed_items(items, 3)) == [items[0], items[2], items[4]]
+    assert list(select_feed_items(iter(items), 3)) == [items[0], items[2], items[4]]
+
+
+def test_max_items_keeps_order_under_cap() -> None:
+    """Test that a feed within the cap keeps the collection's order."""
+    items = [make_item(index) for index in (3, 0, 4, 1, 2)]
+    guids = [guid.text for guid in render(items, max_items=5).iter("guid")]
+    assert guids == [item.feed_id for item in items]
+    assert select_feed_items(items, 5) is items
+    assert list(select_feed_items(iter(items), 10)) == items
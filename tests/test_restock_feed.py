@@ -101,12 +101,15 @@ def test_no_restock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         def download_image(self, *args: object, **kwargs: object) -> None:  # noqa: ARG002
             return None
 
+        def download_many(self, *args: object, **kwargs: object) -> dict[str, Path | None]:  # noqa: ARG002
+            return {}
+
         def get_github_pages_url(self, *args: object, **kwargs: object) -> None:  # noqa: ARG002
             return None
 
     monkeypatch.setattr("main.ImageDownloader", DummyDownloader)
     monkeypatch.setattr("main.append_keys_data_to_csv", lambda *a, **kw: None)  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType] # noqa: ARG005
-    monkeypatch.setattr("main.RSSFeedGenerator", lambda *a, **kw: type("G", (), {"generate_feed": lambda s, c, d, t: "<rss></rss>"})())  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType] # noqa: ARG005
+    monkeypatch.setattr("main.RSSFeedGenerator", lambda *a, **kw: type("G", (), {"generate_feed": lambda s, c, d, o, t: o.write(b"<rss></rss>")})())  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType] # noqa: ARG005
     run_main()
     dev_feed = Path("pages/amd_gaming_promotions_dev.xml")
     assert not dev_feed.exists() or not dev_feed.read_text(encoding="utf-8")
@@ -171,12 +174,15 @@ def test_restock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         def download_image(self, *args: object, **kwargs: object) -> None:  # noqa: ARG002
             return None
 
+        def download_many(self, *args: object, **kwargs: object) -> dict[str, Path | None]:  # noqa: ARG002
+            return {}
+
         def get_github_pages_url(self, *args: object, **kwargs: object) -> None:  # noqa: ARG002
             return None
 
     monkeypatch.setattr("main.ImageDownloader", DummyDownloader)
     monkeypatch.setattr("main.append_keys_data_to_csv", lambda *a, **kw: None)  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType] # noqa: ARG005
-    monkeypatch.setattr("main.RSSFeedGenerator", lambda *a, **kw: type("G", (), {"generate_feed": lambda s, c, d, t: "<rss>restocked</rss>"})())  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType] # noqa: ARG005
+    monkeypatch.setattr("main.RSSFeedGenerator", lambda *a, **kw: type("G", (), {"generate_feed": lambda s, c, d, o, t: o.write(b"<rss>restocked</rss>")})())  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType] # noqa: ARG005
     run_main()
     dev_feed = Path("pages/amd_gaming_promotions_dev.xml")
     assert dev_feed.exists()
@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from dataclasses import field
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from amd.scrapers import DATA_DIR
+from amd.scrapers import ETAG_FILENAME
+from amd.scrapers import RESPONSE_FILENAME
+from amd.scrapers import AMDGamingScraper
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from amd.models import PromotionsResponse
+
+PROMOTION: dict[str, object] = {
+    "id": "p1",
+    "title": "Game",
+    "slug": "game",
+    "content": "",
+    "gameWebsiteUrl": "https://example.com/game",
+    "platform": "Steam",
+    "developer": "Dev",
+    "thumbnailImageUrl": "",
+    "tags": "",
+    "color": "#fff",
+    "status": "active",
+    "featured": False,
+    "keysAvailable": 5,
+    "maxKeysPerIp": 1,
+    "createdAt": 1765209914,
+    "updatedAt": 1765209914,
+    "redemptionInstructions": "",
+    "consumerId": "c",
+    "deleted": False,
+}
+
+
+@dataclass
+class FakeResponse:
+    status_code: int
+    content: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict[str, str])
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= HTTPStatus.BAD_REQUEST:
+            msg = f"HTTP {self.status_code}"
+            raise OSError(msg)
+
+
+@dataclass
+class FakeSession:
+    response: FakeResponse
+    request_headers: list[dict[str, str]] = field(default_factory=list[dict[str, str]])
+
+    def get(self, url: str, headers: dict[str, str], **kwargs: object) -> FakeResponse:  # noqa: ARG002
+        self.request_headers.append(dict(headers))
+        return self.response
+
+
+def fetch(response: FakeResponse) -> tuple[PromotionsResponse, FakeSession]:
+    scraper = AMDGamingScraper()
+    session = FakeSession(response)
+    scraper.session = session  # pyright: ignore[reportAttributeAccessIssue]
+    return scraper.fetch_promotions(), session
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run in an empty directory, so the scraper reads and writes a throwaway pages/data.
+
+    Returns:
+        The pages/data directory inside tmp_path
+    """
+    monkeypatch.chdir(tmp_path)
+    data_dir: Path = tmp_path / DATA_DIR
+    data_dir.mkdir(parents=True)
+    return data_dir
+
+
+def test_not_modified_uses_saved_response(data_dir: Path) -> None:
+    """Test that a 304 answer to If-None-Match returns the saved response."""
+    (data_dir / RESPONSE_FILENAME).write_bytes(orjson.dumps({"items": [PROMOTION]}))
+    (data_dir / ETAG_FILENAME).write_text('"v1"\n', encoding="utf-8")
+
+    promotions, session = fetch(FakeResponse(HTTPStatus.NOT_MODIFIED))
+
+    assert session.request_headers[0]["If-None-Match"] == '"v1"'
+    assert [item.id for item in promotions.items] == ["p1"]
+    assert (data_dir / ETAG_FILENAME).read_text(encoding="utf-8") == '"v1"\n'
+
+
+def test_ok_saves_response_and_etag(data_dir: Path) -> None:
+    """Test that a 200 response is saved along with its ETag."""
+    promotions, session = fetch(FakeResponse(HTTPStatus.OK, orjson.dumps({"items": [PROMOTION]}), {"etag": '"v2"'}))
+
+    # Nothing saved yet, so the request is unconditional
+    assert "If-None-Match" not in session.request_headers[0]
+    assert [item.id for item in promotions.items] == ["p1"]
+    assert orjson.loads((data_dir / RESPONSE_FILENAME).read_bytes()) == {"items": [PROMOTION]}
+    assert (data_dir / ETAG_FILENAME).read_text(encoding="utf-8") == '"v2"\n'
+
+
+def test_ok_without_etag_removes_stale_etag(data_dir: Path) -> None:
+    """Test that a 200 response without an ETag removes the ETag of the previous response."""
+    (data_dir / ETAG_FILENAME).write_text('"v1"\n', encoding="utf-8")
+
+    fetch(FakeResponse(HTTPStatus.OK, orjson.dumps({"items": [PROMOTION]})))
+
+    assert (data_dir / RESPONSE_FILENAME).exists()
+    assert not (data_dir / ETAG_FILENAME).exists()
+
+
+def test_invalid_response_is_not_saved(data_dir: Path) -> None:
+    """Test that a body that fails validation is neither saved nor has its ETag recorded."""
+    saved: bytes = orjson.dumps({"items": [PROMOTION]})
+    (data_dir / RESPONSE_FILENAME).write_bytes(saved)
+    (data_dir / ETAG_FILENAME).write_text('"v1"\n', encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        fetch(FakeResponse(HTTPStatus.OK, b'{"items": "not a list"}', {"etag": '"bad"'}))
+
+    assert (data_dir / RESPONSE_FILENAME).read_bytes() == saved
+    assert (data_dir / ETAG_FILENAME).read_text(encoding="utf-8") == '"v1"\n'
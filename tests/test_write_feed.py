@@ -0,0 +1,98 @@
+import re
+from datetime import UTC
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from amd.models import PromotionItem
+from amd.models import PromotionsResponse
+from feed_generator import RSSFeedGenerator
+from main import build_amd_promotion_description
+from main import extract_last_build_date
+from main import write_feed_if_changed
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+OLD_BUILD_DATE = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def make_promotion(promotion_id: str, title: str, content: str = "Line one\r\nLine two") -> PromotionItem:
+    return PromotionItem.model_validate({
+        "id": promotion_id,
+        "title": title,
+        "slug": promotion_id,
+        "content": content,
+        "gameWebsiteUrl": "https://example.com/game",
+        "platform": "Steam",
+        "developer": "Dev",
+        "thumbnailImageUrl": "",
+        "tags": "Action",
+        "color": "#fff",
+        "status": "active",
+        "featured": False,
+        "keysAvailable": 5,
+        "maxKeysPerIp": 1,
+        "createdAt": 1765209914,
+        "updatedAt": 1765209914,
+        "redemptionInstructions": "",
+        "consumerId": "c",
+        "deleted": False,
+    })
+
+
+def strip_trailing_whitespace(path: Path) -> None:
+    """Strip trailing whitespace from every line like the trailing-whitespace pre-commit hook."""
+    lines: list[bytes] = []
+    for line in path.read_bytes().splitlines(keepends=True):
+        eol: bytes = b"\r\n" if line.endswith(b"\r\n") else b"\n" if line.endswith(b"\n") else b""
+        lines.append(line.rstrip(b"\r\n").rstrip() + eol)
+    path.write_bytes(b"".join(lines))
+
+
+def test_write_feed_if_changed(tmp_path: Path) -> None:
+    """Test that a feed is only rewritten when more than its lastBuildDate would change."""
+    generator = RSSFeedGenerator(channel_title="Test", channel_link="https://example.com", channel_description="Test feed")
+    output_path = tmp_path / "feed.xml"
+    promotions = PromotionsResponse(items=[make_promotion("a", "A"), make_promotion("b", "B")])
+
+    # Existing feed with an old lastBuildDate, as left by an earlier run
+    with output_path.open("wb") as f:
+        generator.generate_feed(promotions, build_amd_promotion_description, f, OLD_BUILD_DATE)
+    original: bytes = output_path.read_bytes()
+
+    # Same promotions: byte-identical, so the file is left alone
+    assert not write_feed_if_changed(generator, promotions, output_path)
+    assert output_path.read_bytes() == original
+
+    # Same promotions, but the file on disk has CRLF line endings (the description already has a CRLF of its own)
+    crlf: bytes = re.sub(rb"(?<!\r)\n", b"\r\n", original)
+    assert crlf != original
+    output_path.write_bytes(crlf)
+    assert not write_feed_if_changed(generator, promotions, output_path)
+    assert output_path.read_bytes() == crlf
+
+    # One changed item: the feed is rewritten with a new lastBuildDate
+    output_path.write_bytes(original)
+    changed = PromotionsResponse(items=[make_promotion("a", "A (restocked)"), make_promotion("b", "B")])
+    assert write_feed_if_changed(generator, changed, output_path)
+    rewritten: bytes = output_path.read_bytes()
+    assert b"A (restocked)" in rewritten
+    last_build_date: datetime | None = extract_last_build_date(rewritten)
+    assert last_build_date is not None
+    assert last_build_date > OLD_BUILD_DATE
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_trailing_whitespace_hook_does_not_trigger_rewrite(tmp_path: Path) -> None:
+    """Test that a feed still matches after the trailing-whitespace hook has run over it."""
+    generator = RSSFeedGenerator(channel_title="Test", channel_link="https://example.com", channel_description="Test feed")
+    output_path = tmp_path / "feed.xml"
+    promotions = PromotionsResponse(items=[make_promotion("a", "A", content="Line one  \r\nLine two\t\nLine three")])
+
+    with output_path.open("wb") as f:
+        generator.generate_feed(promotions, build_amd_promotion_description, f, OLD_BUILD_DATE)
+    strip_trailing_whitespace(output_path)
+    committed: bytes = output_path.read_bytes()
+
+    assert not write_feed_if_changed(generator, promotions, output_path)
+    assert output_path.read_bytes() == committed